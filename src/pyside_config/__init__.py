@@ -1,34 +1,72 @@
-from PySide6 import QtWidgets
-
-if not QtWidgets.QApplication.organizationName() or not QtWidgets.QApplication.applicationName():
-    raise RuntimeError("App name and organization must be set before importing `pyside_config`.")
-
-from ._pyside_config import (
-    QTYPE_KEY,
-    EditorWidgetInfo,
-    clean,
-    config,
-    create_editor,
-    create_snapshot,
-    get_config,
-    reset,
-    restore_snapshot,
-    save,
-    update_value,
-)
-from .properties import SETTER_KEY
+import importlib
+import typing as t
+
+if t.TYPE_CHECKING:
+    from ._pyside_config import (
+        QTYPE_KEY,
+        EditorWidgetInfo,
+        clean,
+        config,
+        create_columnar_snapshot,
+        create_editor,
+        create_snapshot,
+        flush,
+        get_config,
+        register,
+        reset,
+        restore_snapshot,
+        save,
+        update_value,
+    )
+    from .properties import SETTER_KEY
+
+# Maps each public name to the submodule defining it. The submodule is only imported once the name is first accessed.
+_LAZY_EXPORTS = {
+    "config": "._pyside_config",
+    "get_config": "._pyside_config",
+    "register": "._pyside_config",
+    "clean": "._pyside_config",
+    "create_editor": "._pyside_config",
+    "create_snapshot": "._pyside_config",
+    "create_columnar_snapshot": "._pyside_config",
+    "reset": "._pyside_config",
+    "restore_snapshot": "._pyside_config",
+    "save": "._pyside_config",
+    "flush": "._pyside_config",
+    "update_value": "._pyside_config",
+    "EditorWidgetInfo": "._pyside_config",
+    "QTYPE_KEY": "._pyside_config",
+    "SETTER_KEY": ".properties",
+}
 
 __all__ = [
     "config",
     "get_config",
+    "register",
     "clean",
     "create_editor",
     "create_snapshot",
+    "create_columnar_snapshot",
     "reset",
     "restore_snapshot",
     "save",
+    "flush",
     "update_value",
     "EditorWidgetInfo",
     "QTYPE_KEY",
     "SETTER_KEY",
 ]
+
+
+def __getattr__(name: str) -> t.Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache the value so later lookups bypass `__getattr__`
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
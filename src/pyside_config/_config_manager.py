@@ -1,6 +1,6 @@
 import typing as t
 
-from bidict import ON_DUP_RAISE, OnDup, bidict
+from bidict import ON_DUP_RAISE, KeyDuplicationError, OnDup, OnDupAction
 from PySide6 import QtCore, QtWidgets
 
 from ._handlers import DEFAULT_EDITORS
@@ -16,17 +16,31 @@ class ConfigManagerBase(QtCore.QObject):
         super().__init__(parent)
 
         self._mutex = QtCore.QMutex()
-        self._editor_registry = DEFAULT_EDITORS
-        self._configs: bidict[str, type["ConfigInstance"]] = bidict()
+        self._editor_registry = dict(DEFAULT_EDITORS)
+        self._configs: dict[str, type["ConfigInstance"]] = {}
 
         if configs is not None:
             self.register_configs(configs)
 
     def register_configs(self, configs: t.Iterable[type["ConfigInstance"]], *, on_dup: OnDup = ON_DUP_RAISE) -> None:
-        self._configs.putall([(config.__group_prefix__, config) for config in configs], on_dup=on_dup)
+        # Only the key policy of `on_dup` applies, a config class is always registered under its own group prefix.
+        # Registering a class under the name it is already registered with is a no-op. All configs are checked before
+        # any is added, so a duplicate under `OnDupAction.RAISE` leaves the registry unchanged.
+        new_configs: dict[str, type["ConfigInstance"]] = {}
+        for config in configs:
+            name = config.__group_prefix__
+            if self._configs.get(name, new_configs.get(name)) is config:
+                continue
+            if name in self._configs or name in new_configs:
+                if on_dup.key is OnDupAction.RAISE:
+                    raise KeyDuplicationError(name)
+                if on_dup.key is OnDupAction.DROP_NEW:
+                    continue
+            new_configs[name] = config
+        self._configs.update(new_configs)
 
     def register_config(self, config: type["ConfigInstance"], *, on_dup: OnDup = ON_DUP_RAISE) -> None:
-        self._configs.put(config.__group_prefix__, config, on_dup=on_dup)
+        self.register_configs((config,), on_dup=on_dup)
 
     def unregister_config(self, name: str) -> None:
         del self._configs[name]
@@ -1,5 +1,6 @@
 import decimal
 import enum
+import types
 import typing as t
 from collections.abc import Callable
 from operator import attrgetter, methodcaller
@@ -186,14 +187,14 @@ class EditorHooks(t.NamedTuple):
             hooks = EditorHooks.from_names("valueChanged", "value", "setValue")
             ```
         """
-        return cls(
-            attrgetter(value_changed),
-            methodcaller(value_getter),
-            lambda editor, value: methodcaller(value_setter, value)(editor),
-        )
 
+        def _value_setter(editor: WidgetOrAction, value: t.Any) -> None:
+            getattr(editor, value_setter)(value)
 
-DEFAULT_EDITORS: dict[type[WidgetOrAction], EditorHooks] = {
+        return cls(attrgetter(value_changed), methodcaller(value_getter), _value_setter)
+
+
+_DEFAULT_EDITORS: dict[type[WidgetOrAction], EditorHooks] = {
     DecimalSpinBox: EditorHooks(_decimal_spin_box_updated, _decimal_spin_box_getter, _decimal_spin_box_setter),
     EnumComboBox: EditorHooks(_enum_combo_box_updated, _enum_combo_box_getter, _enum_combo_box_setter),
     QtGui.QAction: EditorHooks(_action_updated, _action_getter, _action_setter),
@@ -205,6 +206,7 @@ DEFAULT_EDITORS: dict[type[WidgetOrAction], EditorHooks] = {
     QtWidgets.QSlider: EditorHooks(_slider_updated, _slider_getter, _slider_setter),
     QtWidgets.QSpinBox: EditorHooks(_spin_box_updated, _spin_box_getter, _spin_box_setter),
 }
+DEFAULT_EDITORS: t.Mapping[type[WidgetOrAction], EditorHooks] = types.MappingProxyType(_DEFAULT_EDITORS)
 
 
 def _to_editor_hooks(value: EditorHooks | tuple[str, str, str] | None) -> EditorHooks | None:
@@ -252,7 +254,7 @@ class FieldArgs(t.TypedDict, t.Generic[T_Value], total=False):
     repr: _ReprArgType
     hash: bool | None
     init: bool
-    converter: _ConverterType | attrs.Converter[t.Any, T_Value] | None
+    converter: "_ConverterType | attrs.Converter[t.Any, T_Value] | None"
     factory: Callable[[], T_Value] | None
     kw_only: bool
     eq: _EqOrderType | None
@@ -1,13 +1,17 @@
+import contextlib
+import enum
+import threading
 import typing as t
 from abc import abstractmethod
+from functools import partial
 
 import attrs
-from attr._make import Factory
-from bidict import bidict
-from PySide6 import QtCore, QtGui, QtWidgets
-from pyside_widgets import SettingCard
+from PySide6 import QtCore, QtWidgets
 
 if t.TYPE_CHECKING:
+    from PySide6 import QtGui
+
+    from ._handlers import EditorHooks
     from .properties import WidgetPropertiesBase
 
 QTYPE_KEY = "__qtype"  # This key's value should be a valid argument to the `type` argument of `QtCore.QSettings.value`
@@ -21,6 +25,9 @@ class ConfigInstance(attrs.AttrsInstance, t.Protocol):
     """
 
     __group_prefix__: t.ClassVar[str]
+    __setting_paths__: t.ClassVar[dict[str, str]]
+    __field_plan__: t.ClassVar[tuple["_FieldPlan", ...]]
+    __editor_plan__: t.ClassVar[tuple[tuple["_FieldPlan", "EditorWidgetInfo[QtWidgets.QWidget]"], ...]]
 
     @classmethod
     @abstractmethod
@@ -41,7 +48,122 @@ def _get_fields(cls: type[attrs.AttrsInstance]) -> tuple["attrs.Attribute[t.Any]
     return attrs.fields(cls)
 
 
-_config_registry: bidict[str, ConfigInstance] = bidict()
+class _BulkState(threading.local):
+    depth = 0  # Number of active `_bulk_qsettings` blocks in this thread, syncing is deferred while this is non-zero
+
+
+_config_registry: dict[str, ConfigInstance] = {}
+# Configs can be written from any thread, so every use of the shared `_settings` instance and `_value_cache` holds
+# this lock
+_lock = threading.RLock()
+_settings: QtCore.QSettings | None = None
+_sync_timer: QtCore.QTimer | None = None
+_SYNC_DELAY_MS = 250
+_bulk_state = _BulkState()  # Per-thread state of `_bulk_qsettings` blocks
+_value_cache: dict[str, t.Any] = {}  # Last value written to each QSettings path
+_MISSING = object()
+
+
+def _ensure_app_identity() -> None:
+    """
+    Raises a `RuntimeError` if the application name or organization has not been set yet.
+
+    QSettings uses both to determine where settings are stored, so they must be set before any config is read or written.
+    """
+    if not QtCore.QCoreApplication.organizationName() or not QtCore.QCoreApplication.applicationName():
+        raise RuntimeError("App name and organization must be set before using `pyside_config`.")
+
+
+def _get_settings() -> QtCore.QSettings:
+    """
+    Returns the `QtCore.QSettings` instance shared by all config classes, creating it on first use.
+
+    Constructing `QSettings` re-resolves the organization/application names and the storage backend, so a single
+    instance is reused instead of creating a new one for every read or write.
+
+    Raises:
+        RuntimeError: If the application name or organization has not been set when the instance is first created.
+    """
+    global _settings
+    with _lock:
+        if _settings is None:
+            _ensure_app_identity()
+            _settings = QtCore.QSettings()
+        return _settings
+
+
+def _schedule_sync() -> None:
+    """
+    (Re)starts the timer that flushes pending QSettings changes to permanent storage.
+
+    The timer is restarted on every call, so a burst of writes (e.g. from dragging a slider in an editor) results in a
+    single flush once the writes stop. The timer is created by the first call made while a `QCoreApplication` exists,
+    which also connects `flush` to `QCoreApplication.aboutToQuit`, so pending changes are written when the application
+    exits.
+
+    Without an application there is no event loop to run the timer, and the timer can only be started from the
+    application's thread, so in both of those cases the changes are flushed right away instead.
+    """
+    global _sync_timer
+    if _bulk_state.depth:
+        return
+    app = QtCore.QCoreApplication.instance()
+    if app is None or QtCore.QThread.currentThread() != app.thread():
+        flush()
+        return
+    if _sync_timer is None:
+        _sync_timer = QtCore.QTimer()
+        _sync_timer.setSingleShot(True)
+        _sync_timer.setInterval(_SYNC_DELAY_MS)
+        _sync_timer.timeout.connect(flush)
+        app.aboutToQuit.connect(flush)
+    _sync_timer.start()
+
+
+@contextlib.contextmanager
+def _bulk_qsettings() -> t.Generator[None, None, None]:
+    """
+    Context manager for code that writes many values at once.
+
+    No sync is scheduled for the writes made inside the block, instead all changes are flushed once when the outermost
+    block exits. The depth is tracked per thread, so a block only defers the syncs of writes made by its own thread.
+    """
+    _bulk_state.depth += 1
+    try:
+        yield
+    finally:
+        _bulk_state.depth -= 1
+        if not _bulk_state.depth:
+            flush()
+
+
+def _is_immutable(value: t.Any) -> bool:
+    """
+    Returns whether `value` is of a type that is known to be immutable.
+
+    Being hashable is not enough, e.g. `QSize` and `QFont` are hashable but can be modified in place.
+    """
+    if value is None or type(value) in (int, float, str, bool, bytes) or isinstance(value, enum.Enum):
+        return True
+    return type(value) is tuple and all(_is_immutable(item) for item in t.cast(tuple[t.Any, ...], value))
+
+
+def _is_unchanged(path: str, value: t.Any) -> bool:
+    """
+    Returns whether `value` is the same as the value last written to `path` by this module.
+
+    Only immutable values are compared. Any other value could have been modified in place after it was written, in
+    which case the cached object is the modified value itself and comparing against it would wrongly skip the write.
+
+    Args:
+        path (str): The QSettings path of the value.
+        value (Any): The value that is about to be written.
+
+    Returns:
+        bool: True if writing `value` to `path` can be skipped, False otherwise.
+    """
+    cached = _value_cache.get(path, _MISSING)
+    return _is_immutable(value) and type(cached) is type(value) and cached == value
 
 
 def _register(config_class: type[ConfigInstance], overwrite: bool = False) -> None:
@@ -57,14 +179,32 @@ def _register(config_class: type[ConfigInstance], overwrite: bool = False) -> No
         overwrite (bool, optional): Whether to overwrite an existing config class with the same name. Defaults to False.
     """
     name = config_class.__group_prefix__
-    config_instance = config_class.from_qsettings()
-
-    if overwrite or name not in _config_registry:
-        _config_registry[name] = config_instance
-    else:
+    if not overwrite and name in _config_registry:
         raise ValueError(f"A config class with name '{name}' already exists. To replace it, set `overwrite=True`.")
 
-    config_instance.to_qsettings()
+    config_instance, missing = _load_from_qsettings(config_class)
+    _config_registry[name] = config_instance
+
+    # Fields without a stored value use their default, which still needs to be written
+    if missing:
+        config_instance.to_qsettings()
+
+
+def register(config_class: type[ConfigInstance], overwrite: bool = False) -> None:
+    """
+    Registers a config class that was created with `@config(register=False)`.
+
+    Registering loads the config's values from QSettings, so deferring it until the application name and organization
+    are set avoids reading settings while the defining module is imported.
+
+    Args:
+        config_class (Type[ConfigInstance]): The config class to register.
+        overwrite (bool, optional): Whether to overwrite an existing config class with the same name. Defaults to False.
+
+    Raises:
+        ValueError: If a config class with the same name is already registered and `overwrite` is False.
+    """
+    _register(config_class, overwrite)
 
 
 def get_config(name: str) -> ConfigInstance:
@@ -86,6 +226,23 @@ def save() -> None:
     """
     for config_class in _config_registry.values():
         config_class.to_qsettings()
+    flush()
+
+
+def flush() -> None:
+    """
+    Immediately writes all pending changes to permanent storage.
+
+    Assigning to a config attribute updates QSettings right away, but the changes are only flushed to disk after a
+    short delay so that bursts of changes are written at once. This function is connected to
+    `QCoreApplication.aboutToQuit` automatically, call it directly if the changes need to be on disk sooner.
+    """
+    # Timers can only be stopped from the thread they belong to. If the timer still fires afterwards, it syncs again,
+    # which is harmless.
+    if _sync_timer is not None and QtCore.QThread.currentThread() == _sync_timer.thread():
+        _sync_timer.stop()
+    with _lock:
+        _get_settings().sync()
 
 
 def reset(exclude: t.Iterable[str] | None = None) -> None:
@@ -97,13 +254,15 @@ def reset(exclude: t.Iterable[str] | None = None) -> None:
     Args:
         exclude (Iterable[str] | None, optional): An iterable of config names to exclude from resetting or `None` to reset all configs.
     """
-    if not exclude:
-        for config_class in _config_registry.values():
-            config_class.restore_defaults()
-    else:
-        for name, config_class in _config_registry.items():
-            if name not in exclude:
+    exclude = frozenset(exclude or ())
+    with _bulk_qsettings():
+        if not exclude:
+            for config_class in _config_registry.values():
                 config_class.restore_defaults()
+        else:
+            for name, config_class in _config_registry.items():
+                if name not in exclude:
+                    config_class.restore_defaults()
 
 
 def clean(exclude: t.Iterable[str] | None = None) -> None:
@@ -116,16 +275,21 @@ def clean(exclude: t.Iterable[str] | None = None) -> None:
     Args:
         exclude (Iterable[str] | None, optional): A list of registered config names to exclude from cleaning or `None` to clean all settings.
     """
-    qsettings = QtCore.QSettings()
+    exclude = frozenset(exclude or ())
 
-    if not exclude:
-        qsettings.clear()
-    else:
-        for name in list(qsettings.childGroups()):
-            if name not in exclude:
+    with _lock:
+        qsettings = _get_settings()
+        if not exclude:
+            qsettings.clear()
+        else:
+            stale_groups = [name for name in qsettings.childGroups() if name not in exclude]
+            if not stale_groups:
+                return
+            for name in stale_groups:
                 qsettings.remove(name)
 
-    qsettings.sync()
+        _value_cache.clear()
+    flush()
 
 
 def update_value(group: str, key: str, value: t.Any) -> None:
@@ -140,17 +304,14 @@ def update_value(group: str, key: str, value: t.Any) -> None:
     Raises:
         ValueError: If the config class or attribute does not exist.
     """
-    try:
-        config_class = get_config(group)
-    except KeyError as e:
-        raise ValueError(f"No config class registered with name '{group}'") from e
+    config_class = _config_registry.get(group)
+    if config_class is None:
+        raise ValueError(f"No config class registered with name '{group}'")
 
-    if hasattr(config_class, key):
-        setattr(config_class, key, value)
-    else:
+    if key not in config_class.__setting_paths__:
         raise ValueError(f"No attribute '{key}' in config class '{group}'")
 
-    config_class.to_qsettings()
+    setattr(config_class, key, value)
 
 
 def create_snapshot() -> dict[str, t.Any]:
@@ -163,7 +324,42 @@ def create_snapshot() -> dict[str, t.Any]:
         dict[str, Any]: A dictionary where keys are the names of registered configuration groups and values are
         dictionaries representing the current state of each group's attributes.
     """
-    return {key: attrs.asdict(inst) for key, inst in _config_registry.items()}
+    return {
+        key: {field.name: _snapshot_value(getattr(inst, field.name)) for field in inst.__field_plan__}
+        for key, inst in _config_registry.items()
+    }
+
+
+def _snapshot_value(value: t.Any) -> t.Any:
+    """
+    Returns a shallow copy of mutable builtin containers, so that modifying a config value in place doesn't change
+    previously created snapshots. All other values are returned as is.
+    """
+    if isinstance(value, list | dict | set):
+        return t.cast(t.Any, value.copy())
+    return value
+
+
+def create_columnar_snapshot() -> dict[str, dict[str, tuple[t.Any, ...]]]:
+    """
+    Creates a snapshot of the current state of all registered configuration groups, with the attribute names and
+    values of each group stored in two parallel tuples.
+
+    Two columnar snapshots of the same configs can be compared group by group with a single tuple comparison, which is
+    faster than comparing the nested dictionaries returned by `create_snapshot`.
+
+    Returns:
+        dict[str, dict[str, tuple[Any, ...]]]: A dictionary where keys are the names of registered configuration groups
+        and values are dictionaries with a `"names"` tuple holding the group's attribute names and a `"values"` tuple
+        holding their current values in the same order.
+    """
+    return {
+        key: {
+            "names": tuple(field.name for field in inst.__field_plan__),
+            "values": tuple(_snapshot_value(getattr(inst, field.name)) for field in inst.__field_plan__),
+        }
+        for key, inst in _config_registry.items()
+    }
 
 
 def restore_snapshot(snapshot: dict[str, t.Any]) -> None:
@@ -177,10 +373,26 @@ def restore_snapshot(snapshot: dict[str, t.Any]) -> None:
     Args:
         snapshot (dict[str, Any]): A dictionary representing the snapshot of the configuration groups' state to
         restore.
+
+    Raises:
+        ValueError: If the snapshot contains a config class or attribute that does not exist. Nothing is restored in
+        this case.
     """
+    # Validate the whole snapshot first so that a bad entry doesn't leave the configs partially restored
+    restore: list[tuple[ConfigInstance, dict[str, t.Any]]] = []
     for grp, grp_dict in snapshot.items():
-        for key, value in grp_dict.items():
-            update_value(grp, key, value)
+        config_class = _config_registry.get(grp)
+        if config_class is None:
+            raise ValueError(f"No config class registered with name '{grp}'")
+        for key in grp_dict:
+            if key not in config_class.__setting_paths__:
+                raise ValueError(f"No attribute '{key}' in config class '{grp}'")
+        restore.append((config_class, grp_dict))
+
+    with _bulk_qsettings():
+        for config_class, grp_dict in restore:
+            for key, value in grp_dict.items():
+                setattr(config_class, key, value)
 
 
 def create_editor(
@@ -192,6 +404,10 @@ def create_editor(
     If no `exclude` list is provided, all registered configs are created. Otherwise, only the configs not related
     to the specified config names are created.
 
+    Each tab is a scroll area whose editor widgets are only created when the tab is first shown or its `widget()` is
+    first accessed. Errors from creating the editor widgets (e.g. an invalid `set_value_method` in the editor info) are
+    therefore raised at that point, typically from `show()` or `exec()` of the dialog, not from this function.
+
     Args:
         parent (QtWidgets.QWidget | None, optional): The parent widget for the dialog. Defaults to None.
         exclude (Iterable[str] | None, optional): An iterable of config names to exclude from the editor.
@@ -211,9 +427,10 @@ def create_editor(
     btn_box.accepted.connect(dlg.accept)
     btn_box.rejected.connect(dlg.reject)
 
+    exclude = frozenset(exclude or ())
     tab_widget = QtWidgets.QTabWidget()
     for name, inst in _config_registry.items():
-        if exclude is None or name not in exclude:
+        if name not in exclude:
             tab = inst.create_editor()
             tab_widget.addTab(tab, name)
 
@@ -227,13 +444,52 @@ def create_editor(
     return dlg
 
 
-class EditorWidgetInfo[W: QtWidgets.QWidget](t.NamedTuple):
+@attrs.frozen
+class EditorWidgetInfo[W: QtWidgets.QWidget]:
     label: str
     widget_factory: t.Callable[..., W]
     sig_value_changed: str
     set_value_method: str
-    icon: QtGui.QIcon | None = None
+    icon: "QtGui.QIcon | None" = None
     widget_properties: "WidgetPropertiesBase[W] | None" = None
+    # If set, used instead of looking up `set_value_method` and `sig_value_changed` on the editor widget by name
+    hooks: "EditorHooks | None" = None
+
+
+class _FieldPlan(t.NamedTuple):
+    """
+    Information about a field of a config class that is looked up once when the class is created, so that reading,
+    writing and editing the config never has to go through the field's metadata.
+    """
+
+    name: str
+    path: str
+    qtype: type | None
+    default: t.Any  # `None` if the default is created by `default_factory`
+    default_factory: t.Callable[[], t.Any] | None
+    editor: "EditorWidgetInfo[QtWidgets.QWidget] | None"
+    description: str | None
+
+
+def _build_field_plan(cls: type[ConfigInstance]) -> tuple[_FieldPlan, ...]:
+    plan: list[_FieldPlan] = []
+    for field in _get_fields(cls):
+        default = field.default
+        default_factory = None
+        if isinstance(default, attrs.Factory):  # type: ignore
+            default, default_factory = None, default.factory  # type: ignore
+        plan.append(
+            _FieldPlan(
+                name=field.name,
+                path=_get_setting_path(cls, field),
+                qtype=field.metadata.get(QTYPE_KEY, None),
+                default=default,
+                default_factory=default_factory,
+                editor=field.metadata.get("editor", None),
+                description=field.metadata.get("description", None),
+            )
+        )
+    return tuple(plan)
 
 
 def _get_setting_path(inst_or_cls: ConfigInstance | type[ConfigInstance], attr: "attrs.Attribute[t.Any]") -> str:
@@ -270,79 +526,156 @@ def _update_qsettings(inst: ConfigInstance, attr: "attrs.Attribute[t.Any]", valu
     Returns:
         Any: The value that was set.
     """
-    path = _get_setting_path(inst, attr)
-    settings = QtCore.QSettings()
-    if path:
-        settings.setValue(path, value)
-        settings.sync()
+    path = inst.__setting_paths__[attr.name]
+    with _lock:
+        if _is_unchanged(path, value):
+            return value
+        _get_settings().setValue(path, value)
+        _value_cache[path] = value
+    _schedule_sync()
     return value
 
 
-def _get_field_default(field: "attrs.Attribute[t.Any]") -> t.Any | None:
-    default = field.default
-    return default.factory() if isinstance(default, Factory) else default  # type: ignore
+def _get_field_default(field: _FieldPlan) -> t.Any | None:
+    return field.default_factory() if field.default_factory is not None else field.default
 
 
 def _from_qsettings(cls: type[ConfigInstance]) -> ConfigInstance:
-    settings = QtCore.QSettings()
+    return _load_from_qsettings(cls)[0]
+
+
+def _load_from_qsettings(cls: type[ConfigInstance]) -> tuple[ConfigInstance, list[str]]:
+    """
+    Creates an instance of `cls` from the stored values, returning it along with the names of the fields that have no
+    stored value and use their default instead.
+    """
     init_values = {}
-    for field in _get_fields(cls):
-        path = _get_setting_path(cls, field)
-        default = _get_field_default(field)
-        qtype: type | None = field.metadata.get(QTYPE_KEY, None)
-        if qtype is not None:
-            value = settings.value(path, defaultValue=default, type=qtype)
-        else:
-            value = settings.value(path, defaultValue=default)
-        init_values[field.name] = value
-    return cls(**init_values)
+    missing: list[str] = []
+    with _lock:
+        settings = _get_settings()
+        settings.beginGroup(cls.__group_prefix__)
+        try:
+            # Fetch the stored keys once, fields without a stored value use their default without querying QSettings
+            stored_keys = set(settings.childKeys())
+            for field in cls.__field_plan__:
+                if field.name not in stored_keys:
+                    init_values[field.name] = _get_field_default(field)
+                    missing.append(field.name)
+                    continue
+
+                if field.qtype is not None:
+                    value = settings.value(field.name, type=field.qtype)
+                else:
+                    value = settings.value(field.name)
+                _value_cache[field.path] = value
+                init_values[field.name] = value
+        finally:
+            settings.endGroup()
+    return cls(**init_values), missing
 
 
 def _to_qsettings(self: ConfigInstance) -> None:
-    settings = QtCore.QSettings()
-    for field in _get_fields(self.__class__):
-        path = _get_setting_path(self, field)
-        value = getattr(self, field.name)
-        settings.setValue(path, value)
-    settings.sync()
+    # Write every field unconditionally, the stored values may have been removed or changed outside of this module, or
+    # modified in place without being reassigned
+    with _lock:
+        settings = _get_settings()
+        settings.beginGroup(self.__group_prefix__)
+        try:
+            for field in self.__field_plan__:
+                value = getattr(self, field.name)
+                settings.setValue(field.name, value)
+                _value_cache[field.path] = value
+        finally:
+            settings.endGroup()
+    _schedule_sync()
 
 
 def _restore_defaults(self: ConfigInstance) -> None:
-    for field in _get_fields(self.__class__):
+    for field in self.__field_plan__:
         _reset_field(self, field)
 
 
-def _reset_field(self: ConfigInstance, field: "attrs.Attribute[t.Any]") -> None:
+def _reset_field(self: ConfigInstance, field: _FieldPlan) -> None:
     default = _get_field_default(field)
     setattr(self, field.name, default)
 
 
+class _LazyScrollArea(QtWidgets.QScrollArea):
+    """
+    A scroll area that creates its content widget the first time it is shown or its `widget()` is requested.
+
+    Used for the editor pages so that pages which are never shown (e.g. unselected tabs of the settings dialog) never
+    create their widgets.
+    """
+
+    def __init__(
+        self, widget_factory: t.Callable[[], QtWidgets.QWidget], parent: QtWidgets.QWidget | None = None
+    ) -> None:
+        super().__init__(parent)
+        self.setWidgetResizable(True)
+        self._widget_factory: t.Callable[[], QtWidgets.QWidget] | None = widget_factory
+
+    def _ensure_widget(self) -> None:
+        # The factory is only cleared once the widget is set, so a page that failed to build raises again on the next
+        # access instead of staying blank
+        if self._widget_factory is not None:
+            self.setWidget(self._widget_factory())
+            self._widget_factory = None
+
+    def widget(self) -> QtWidgets.QWidget:
+        self._ensure_widget()
+        return super().widget()
+
+    def takeWidget(self) -> QtWidgets.QWidget:
+        self._ensure_widget()
+        return super().takeWidget()
+
+    def showEvent(self, event: "QtGui.QShowEvent") -> None:
+        self._ensure_widget()
+        super().showEvent(event)
+
+
 def _create_editor(self: ConfigInstance, **kwargs: t.Any) -> QtWidgets.QScrollArea:
+    """
+    Creates a scroll area with an editor for every field of the config that has editor info.
+
+    The editor widgets are only created once the scroll area is first shown or its `widget()` is first accessed, so
+    pages that are never looked at cost almost nothing. Errors from creating the editor widgets are raised at that point
+    as well.
+    """
+    return _LazyScrollArea(partial(_create_editor_widget, self, **kwargs))
+
+
+def _create_editor_widget(self: ConfigInstance, **kwargs: t.Any) -> QtWidgets.QWidget:
+    from pyside_widgets import SettingCard
+
     container_widget = QtWidgets.QWidget()
 
     layout = QtWidgets.QVBoxLayout(container_widget)
     layout.setAlignment(QtCore.Qt.AlignmentFlag.AlignTop)
 
-    for field in _get_fields(self.__class__):
-        editor_info: "EditorWidgetInfo[QtWidgets.QWidget] | None" = field.metadata.get("editor", None)
-        if not editor_info:
-            continue
-
+    for field, editor_info in self.__editor_plan__:
         editor_widget = editor_info.widget_factory(**kwargs)
         editor_widget_properties = editor_info.widget_properties
 
-        value = getattr(self, field.name)
-
-        # Set the initial value of the editor
-        getattr(editor_widget, editor_info.set_value_method)(value)
-
-        # Update the config value whenever the editor's valueChanged (varies depending on the widget type) signal is emitted
-        getattr(editor_widget, editor_info.sig_value_changed).connect(lambda val, f=field: setattr(self, f.name, val))
-
+        # Apply the properties first so that e.g. a spin box range doesn't clamp the initial value
         if editor_widget_properties is not None:
             editor_widget_properties.apply_to_widget(editor_widget)
 
-        description = field.metadata.get("description", None)
+        value = getattr(self, field.name)
+
+        # Set the initial value of the editor and get its valueChanged (varies depending on the widget type) signal
+        hooks = editor_info.hooks
+        if hooks is not None:
+            hooks.value_setter(editor_widget, value)
+            sig_value_changed = hooks.value_changed(editor_widget)
+        else:
+            getattr(editor_widget, editor_info.set_value_method)(value)
+            sig_value_changed = getattr(editor_widget, editor_info.sig_value_changed)
+
+        # Update the config value whenever the editor's value changes. Connecting only after the initial value is set
+        # means populating the editor never writes back to QSettings.
+        sig_value_changed.connect(partial(setattr, self, field.name))
 
         default_value = _get_field_default(field)
 
@@ -351,16 +684,13 @@ def _create_editor(self: ConfigInstance, **kwargs: t.Any) -> QtWidgets.QScrollAr
             default_value=default_value,
             set_value_name=editor_info.set_value_method,
             editor_widget=editor_widget,
-            description=description,
+            description=field.description,
             icon=editor_info.icon,
         )
-        card.sig_reset_clicked.connect(lambda f=field: _reset_field(self, f))
+        card.sig_reset_clicked.connect(partial(_reset_field, self, field))
         layout.addWidget(card)
 
-    scroll_area = QtWidgets.QScrollArea()
-    scroll_area.setWidgetResizable(True)
-    scroll_area.setWidget(container_widget)
-    return scroll_area
+    return container_widget
 
 
 @t.overload
@@ -377,7 +707,11 @@ def config(
         cls.restore_defaults = _restore_defaults
         cls.create_editor = _create_editor
 
-        attrs_class = attrs.define(cls, eq=False, on_setattr=_update_qsettings)
+        attrs_class = attrs.define(cls, slots=True, eq=False, on_setattr=_update_qsettings)
+        field_plan = _build_field_plan(attrs_class)
+        attrs_class.__field_plan__ = field_plan
+        attrs_class.__editor_plan__ = tuple((field, field.editor) for field in field_plan if field.editor is not None)
+        attrs_class.__setting_paths__ = {field.name: field.path for field in field_plan}
         if register:
             _register(attrs_class)
         return attrs_class
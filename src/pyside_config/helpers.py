@@ -4,6 +4,7 @@ import typing as t
 from PySide6 import QtGui, QtWidgets
 from pyside_widgets import DecimalSpinBox
 
+from ._handlers import EditorHooks
 from ._pyside_config import EditorWidgetInfo
 from .properties import (
     CheckBoxProperties,
@@ -11,6 +12,7 @@ from .properties import (
     DecimalSpinBoxProperties,
     LineEditProperties,
     SpinBoxProperties,
+    WidgetPropertiesBase,
 )
 
 
@@ -55,21 +57,45 @@ class ComboBoxKwargs(t.TypedDict, total=False):
     hasFrame: bool
 
 
+def _make_info[W: QtWidgets.QWidget](
+    *,
+    label: str,
+    widget_factory: t.Callable[..., W],
+    sig_value_changed: str,
+    set_value_method: str,
+    icon: QtGui.QIcon | None,
+    widget_properties: WidgetPropertiesBase[t.Any],
+    hooks: EditorHooks | None,
+) -> EditorWidgetInfo[W]:
+    """Shared implementation of the `make_*_info` helpers, which only differ in their defaults and properties class."""
+    return EditorWidgetInfo(
+        label=label,
+        widget_factory=widget_factory,
+        sig_value_changed=sig_value_changed,
+        set_value_method=set_value_method,
+        icon=icon,
+        widget_properties=widget_properties,
+        hooks=hooks,
+    )
+
+
 def make_line_edit_info(
     label: str,
     widget_factory: t.Callable[..., QtWidgets.QLineEdit] = QtWidgets.QLineEdit,
     sig_value_changed: str = "textChanged",
     set_value_method: str = "setText",
     icon: QtGui.QIcon | None = None,
+    hooks: EditorHooks | None = None,
     **kwargs: t.Unpack[LineEditKwargs],
 ) -> EditorWidgetInfo[QtWidgets.QLineEdit]:
-    return EditorWidgetInfo(
+    return _make_info(
         label=label,
         widget_factory=widget_factory,
         sig_value_changed=sig_value_changed,
         set_value_method=set_value_method,
         icon=icon,
         widget_properties=LineEditProperties(**kwargs),
+        hooks=hooks,
     )
 
 
@@ -79,15 +105,17 @@ def make_check_box_info(
     sig_value_changed: str = "toggled",
     set_value_method: str = "setChecked",
     icon: QtGui.QIcon | None = None,
+    hooks: EditorHooks | None = None,
     **kwargs: t.Unpack[CheckBoxKwargs],
 ) -> EditorWidgetInfo[QtWidgets.QCheckBox]:
-    return EditorWidgetInfo(
+    return _make_info(
         label=label,
         widget_factory=widget_factory,
         sig_value_changed=sig_value_changed,
         set_value_method=set_value_method,
         icon=icon,
         widget_properties=CheckBoxProperties(**kwargs),
+        hooks=hooks,
     )
 
 
@@ -97,15 +125,17 @@ def make_spin_box_info(
     sig_value_changed: str = "valueChanged",
     set_value_method: str = "setValue",
     icon: QtGui.QIcon | None = None,
+    hooks: EditorHooks | None = None,
     **kwargs: t.Unpack[IntSpinBoxKwargs],
 ) -> EditorWidgetInfo[QtWidgets.QSpinBox]:
-    return EditorWidgetInfo(
+    return _make_info(
         label=label,
         widget_factory=widget_factory,
         sig_value_changed=sig_value_changed,
         set_value_method=set_value_method,
         icon=icon,
         widget_properties=SpinBoxProperties(**kwargs),
+        hooks=hooks,
     )
 
 
@@ -115,15 +145,17 @@ def make_double_spin_box_info(
     sig_value_changed: str = "valueChanged",
     set_value_method: str = "setValue",
     icon: QtGui.QIcon | None = None,
+    hooks: EditorHooks | None = None,
     **kwargs: t.Unpack[DoubleSpinBoxKwargs],
 ) -> EditorWidgetInfo[QtWidgets.QDoubleSpinBox]:
-    return EditorWidgetInfo(
+    return _make_info(
         label=label,
         widget_factory=widget_factory,
         sig_value_changed=sig_value_changed,
         set_value_method=set_value_method,
         icon=icon,
         widget_properties=DecimalSpinBoxProperties(**kwargs),
+        hooks=hooks,
     )
 
 
@@ -133,15 +165,17 @@ def make_decimal_spin_box_info(
     sig_value_changed: str = "valueChanged",
     set_value_method: str = "setValue",
     icon: QtGui.QIcon | None = None,
+    hooks: EditorHooks | None = None,
     **kwargs: t.Unpack[DecimalSpinBoxKwargs],
 ) -> EditorWidgetInfo[DecimalSpinBox]:
-    return EditorWidgetInfo(
+    return _make_info(
         label=label,
         widget_factory=widget_factory,
         sig_value_changed=sig_value_changed,
         set_value_method=set_value_method,
         icon=icon,
         widget_properties=DecimalSpinBoxProperties(**kwargs),
+        hooks=hooks,
     )
 
 
@@ -151,13 +185,15 @@ def make_combo_box_info(
     sig_value_changed: str = "currentIndexChanged",
     set_value_method: str = "setCurrentIndex",
     icon: QtGui.QIcon | None = None,
+    hooks: EditorHooks | None = None,
     **kwargs: t.Unpack[ComboBoxKwargs],
 ) -> EditorWidgetInfo[QtWidgets.QComboBox]:
-    return EditorWidgetInfo(
+    return _make_info(
         label=label,
         widget_factory=widget_factory,
         sig_value_changed=sig_value_changed,
         set_value_method=set_value_method,
         icon=icon,
         widget_properties=ComboBoxProperties(**kwargs),
+        hooks=hooks,
     )
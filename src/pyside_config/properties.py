@@ -1,4 +1,6 @@
 import decimal
+import functools
+import typing as t
 
 import attrs
 from PySide6 import QtWidgets, QtGui
@@ -6,7 +8,27 @@ from PySide6 import QtWidgets, QtGui
 SETTER_KEY = "__setter"
 
 
-@attrs.define
+@functools.cache
+def _get_setters(cls: type[attrs.AttrsInstance]) -> tuple[tuple[str, str], ...]:
+    """
+    Returns `(field name, setter method name)` pairs for all fields of the given properties class.
+
+    The result only depends on the class, so it is computed once per class instead of on every `apply_to_widget` call.
+    """
+    return tuple((field.name, field.metadata[SETTER_KEY]) for field in attrs.fields(cls))
+
+
+@functools.cache
+def _get_widget_setter(widget_type: type, setter_name: str) -> t.Callable[..., t.Any]:
+    """
+    Returns the unbound setter method with the given name of a widget class.
+
+    Looking the setter up on the class once avoids resolving it on every widget the properties are applied to.
+    """
+    return getattr(widget_type, setter_name)
+
+
+@attrs.define(eq=False, weakref_slot=False)
 class WidgetPropertiesBase[W: QtWidgets.QWidget | QtGui.QAction]:
     """
     Base class for widget properties.
@@ -24,14 +46,15 @@ class WidgetPropertiesBase[W: QtWidgets.QWidget | QtGui.QAction]:
         Args:
             widget (W): The widget to which the attribute values will be applied.
         """
-        for field in attrs.fields(self.__class__):
-            property_value = getattr(self, field.name)
-            if field.name == "styleSheet" and property_value == "":  # allow using None to clear a style sheet
+        widget_type = type(widget)
+        for name, setter_name in _get_setters(self.__class__):
+            property_value = getattr(self, name)
+            if name == "styleSheet" and property_value == "":  # allow using None to clear a style sheet
                 continue
-            getattr(widget, field.metadata[SETTER_KEY])(property_value)
+            _get_widget_setter(widget_type, setter_name)(widget, property_value)
 
 
-@attrs.define
+@attrs.define(eq=False, weakref_slot=False)
 class SpinBoxProperties[T: int | float | decimal.Decimal](WidgetPropertiesBase[QtWidgets.QAbstractSpinBox]):
     minimum: T = attrs.field(default=0, metadata={SETTER_KEY: "setMinimum"})
     maximum: T = attrs.field(default=1_000_000, metadata={SETTER_KEY: "setMaximum"})
@@ -41,24 +64,24 @@ class SpinBoxProperties[T: int | float | decimal.Decimal](WidgetPropertiesBase[Q
     hasFrame: bool = attrs.field(default=False, metadata={SETTER_KEY: "setFrame"})
 
 
-@attrs.define
+@attrs.define(eq=False, weakref_slot=False)
 class DecimalSpinBoxProperties[T: float | decimal.Decimal](SpinBoxProperties[T]):
     decimals: int = attrs.field(default=2, metadata={SETTER_KEY: "setDecimals"})
 
 
-@attrs.define
+@attrs.define(eq=False, weakref_slot=False)
 class LineEditProperties(WidgetPropertiesBase[QtWidgets.QLineEdit]):
     clearButtonEnabled: bool = attrs.field(default=True, converter=bool, metadata={SETTER_KEY: "setClearButtonEnabled"})
     completer: QtWidgets.QCompleter | None = attrs.field(default=None, metadata={SETTER_KEY: "setCompleter"})
     hasFrame: bool = attrs.field(default=False, metadata={SETTER_KEY: "setFrame"})
 
 
-@attrs.define
+@attrs.define(eq=False, weakref_slot=False)
 class ComboBoxProperties(WidgetPropertiesBase[QtWidgets.QComboBox]):
     isEditable: bool = attrs.field(default=False, metadata={SETTER_KEY: "setEditable"})
     hasFrame: bool = attrs.field(default=False, metadata={SETTER_KEY: "setFrame"})
 
 
-@attrs.define
+@attrs.define(eq=False, weakref_slot=False)
 class CheckBoxProperties(WidgetPropertiesBase[QtWidgets.QCheckBox]):
     isTristate: bool = attrs.field(default=False, metadata={SETTER_KEY: "setTristate"})
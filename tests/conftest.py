@@ -0,0 +1,29 @@
+# pyright: reportPrivateUsage=false
+import os
+import typing as t
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PySide6 import QtCore
+
+from pyside_config import _pyside_config
+
+
+@pytest.fixture(scope="session", autouse=True)
+def app(tmp_path_factory: pytest.TempPathFactory) -> QtCore.QCoreApplication:
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+    app.setOrganizationName("pyside-config-tests")
+    app.setApplicationName("pyside-config-tests")
+    QtCore.QSettings.setDefaultFormat(QtCore.QSettings.Format.IniFormat)
+    QtCore.QSettings.setPath(
+        QtCore.QSettings.Format.IniFormat, QtCore.QSettings.Scope.UserScope, str(tmp_path_factory.mktemp("settings"))
+    )
+    return app
+
+
+@pytest.fixture(autouse=True)
+def clean_state(app: QtCore.QCoreApplication) -> t.Iterator[None]:
+    yield
+    _pyside_config._config_registry.clear()
+    _pyside_config.clean()
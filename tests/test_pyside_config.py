@@ -0,0 +1,193 @@
+# pyright: reportPrivateUsage=false
+import configparser
+import threading
+import typing as t
+
+import attrs
+import pytest
+from PySide6 import QtCore
+
+import pyside_config as pc
+from pyside_config import _pyside_config
+
+
+def _read_from_disk(path: str) -> str | None:
+    # QSettings instances of the same process share unsynced changes, so parse the file itself
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.read(_pyside_config._get_settings().fileName())
+    group, key = path.split("/")
+    return parser.get(group, key, fallback=None)
+
+
+def test_write_from_worker_thread_is_flushed() -> None:
+    @pc.config(group_name="Threaded")
+    class Threaded:
+        value: int = 1
+
+    messages: list[str] = []
+
+    def handler(_mode: QtCore.QtMsgType, _context: QtCore.QMessageLogContext, message: str) -> None:
+        messages.append(message)
+
+    previous_handler = QtCore.qInstallMessageHandler(handler)
+    try:
+        worker = threading.Thread(target=setattr, args=(pc.get_config("Threaded"), "value", 5))
+        worker.start()
+        worker.join()
+    finally:
+        QtCore.qInstallMessageHandler(previous_handler)
+
+    assert not [message for message in messages if "thread" in message.lower()]
+    assert _read_from_disk("Threaded/value") == "5"
+
+
+def test_mutated_hashable_value_is_written_on_reassignment() -> None:
+    @pc.config(group_name="Geometry")
+    class Geometry:
+        size: QtCore.QSize = attrs.Factory(lambda: QtCore.QSize(100, 100))
+
+    geometry = t.cast(Geometry, pc.get_config("Geometry"))
+    size = geometry.size
+    size.setWidth(800)
+    geometry.size = size
+
+    assert _pyside_config._get_settings().value("Geometry/size") == QtCore.QSize(800, 100)
+
+
+def test_save_rewrites_externally_removed_keys() -> None:
+    @pc.config(group_name="Removed")
+    class Removed:
+        value: int = 1
+
+    _pyside_config._get_settings().remove("Removed")
+    pc.save()
+
+    assert _pyside_config._get_settings().allKeys() == ["Removed/value"]
+
+
+def test_save_writes_values_modified_in_place() -> None:
+    @pc.config(group_name="InPlace")
+    class InPlace:
+        size: QtCore.QSize = attrs.Factory(lambda: QtCore.QSize(100, 100))
+
+    t.cast(InPlace, pc.get_config("InPlace")).size.setWidth(800)
+    pc.save()
+
+    assert _read_from_disk("InPlace/size") == "@Size(800 100)"
+
+
+def test_write_without_application_is_flushed(monkeypatch: pytest.MonkeyPatch) -> None:
+    @pc.config(group_name="NoApp")
+    class NoApp:
+        value: int = 1
+
+    monkeypatch.setattr(_pyside_config, "_sync_timer", None)
+    monkeypatch.setattr(_pyside_config.QtCore.QCoreApplication, "instance", staticmethod(lambda: None))
+    t.cast(NoApp, pc.get_config("NoApp")).value = 5
+
+    assert _pyside_config._sync_timer is None
+    assert _read_from_disk("NoApp/value") == "5"
+
+
+def test_sync_timer_is_created_in_application_thread(app: QtCore.QCoreApplication) -> None:
+    @pc.config(group_name="Timer")
+    class Timer:
+        value: int = 1
+
+    t.cast(Timer, pc.get_config("Timer")).value = 5
+
+    timer = _pyside_config._sync_timer
+    assert timer is not None
+    assert timer.thread() == app.thread()
+    assert app.isSignalConnected(QtCore.QMetaMethod.fromSignal(app.aboutToQuit))
+
+
+def test_reregister_writes_back_removed_keys() -> None:
+    @pc.config(group_name="Reregistered", register=False)
+    class Reregistered:
+        value: int = 1
+
+    config_class = t.cast(type[_pyside_config.ConfigInstance], Reregistered)
+    pc.register(config_class)
+    _pyside_config._get_settings().remove("Reregistered")
+    pc.register(config_class, overwrite=True)
+    pc.flush()
+
+    assert _pyside_config._get_settings().allKeys() == ["Reregistered/value"]
+
+
+def test_bulk_block_only_defers_syncs_of_its_own_thread() -> None:
+    @pc.config(group_name="Bulk")
+    class Bulk:
+        value: int = 1
+
+    with _pyside_config._bulk_qsettings():
+        worker = threading.Thread(target=setattr, args=(pc.get_config("Bulk"), "value", 5))
+        worker.start()
+        worker.join()
+
+        assert _read_from_disk("Bulk/value") == "5"
+
+
+def test_register_loads_deferred_config() -> None:
+    @pc.config(group_name="Deferred", register=False)
+    class Deferred:
+        value: int = 1
+
+    assert "Deferred" not in _pyside_config._config_registry
+    assert "Deferred/value" not in _pyside_config._get_settings().allKeys()
+
+    config_class = t.cast(type[_pyside_config.ConfigInstance], Deferred)
+    pc.register(config_class)
+
+    assert t.cast(Deferred, pc.get_config("Deferred")).value == 1
+    assert _pyside_config._get_settings().value("Deferred/value") == 1
+    with pytest.raises(ValueError, match="already exists"):
+        pc.register(config_class)
+
+
+def test_flush_writes_pending_changes_to_disk() -> None:
+    @pc.config(group_name="Pending")
+    class Pending:
+        value: int = 1
+
+    pc.flush()
+    t.cast(Pending, pc.get_config("Pending")).value = 5
+
+    timer = _pyside_config._sync_timer
+    assert timer is not None and timer.isActive()
+    assert _read_from_disk("Pending/value") == "1"
+
+    pc.flush()
+
+    assert not timer.isActive()
+    assert _read_from_disk("Pending/value") == "5"
+
+
+def test_columnar_snapshot_holds_names_and_values_in_field_order() -> None:
+    @pc.config(group_name="Columnar")
+    class Columnar:
+        count: int = 1
+        tags: list[str] = attrs.Factory(lambda: ["a"])
+
+    snapshot = pc.create_columnar_snapshot()
+    t.cast(Columnar, pc.get_config("Columnar")).tags.append("b")
+
+    assert snapshot == {"Columnar": {"names": ("count", "tags"), "values": (1, ["a"])}}
+
+
+def test_restore_snapshot_with_unknown_attribute_restores_nothing() -> None:
+    @pc.config(group_name="Restored")
+    class Restored:
+        value: int = 1
+
+    with pytest.raises(ValueError, match="No attribute 'missing'"):
+        pc.restore_snapshot({"Restored": {"value": 5, "missing": 0}})
+
+    assert t.cast(Restored, pc.get_config("Restored")).value == 1
+    assert _pyside_config._get_settings().value("Restored/value") == 1
+
+    pc.restore_snapshot({"Restored": {"value": 5}})
+
+    assert t.cast(Restored, pc.get_config("Restored")).value == 5
+    assert _read_from_disk("Restored/value") == "5"